@@ -3,7 +3,7 @@
 import sys
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from qiskit import QuantumCircuit
 from qiskit.primitives import BasePrimitiveJob, PrimitiveResult, SamplerPubResult
@@ -11,14 +11,17 @@ from qiskit.providers import BackendV2, JobStatus
 from qiskit.providers.jobstatus import JOB_FINAL_STATES
 from pasqal_cloud import SDK as PasqalSDK
 from pasqal_cloud.device import DeviceTypeName
-from pulser.backend.remote import JobParams, RemoteResults
+from pulser.backend.remote import JobParams
 from pulser.register.register_layout import RegisterLayout
-from pulser_simulation.simresults import SimulationResults
 
 from .layouts import PasqalLayout
 from .target import PasqalTarget
 from ..utils import PasqalExecutor
 
+if TYPE_CHECKING:
+    from pulser.backend.remote import RemoteResults
+    from pulser_simulation.simresults import SimulationResults
+
 # check whether python version is equal or greater than 3.12 to decide which
 #   StrEnum version to import from
 if sys.version_info >= (3, 12):
@@ -139,7 +142,7 @@ class PasqalJob(BasePrimitiveJob[PrimitiveResult[SamplerPubResult], JobStatus],
         self,
         job_params: list[JobParams] | None = None,
         wait: bool | None = None,
-    ) -> SimulationResults | RemoteResults:
+    ) -> "SimulationResults | RemoteResults":
         """
         Check the self._executor run method signature;
         Only compatible with local run.
@@ -3,6 +3,7 @@
 # pylint: disable=import-outside-toplevel
 
 import uuid
+from copy import deepcopy
 from sys import platform
 from typing import Any
 
@@ -17,7 +18,7 @@ from qiskit_pasqal_provider.providers.abstract_base import (
 from qiskit_pasqal_provider.providers.jobs import PasqalLocalJob
 from qiskit_pasqal_provider.providers.pulse_utils import (
     get_register_from_circuit,
-    gen_seq,
+    cached_gen_seq,
 )
 from qiskit_pasqal_provider.providers.target import PasqalTarget
 
@@ -77,7 +78,7 @@ class EmuMpsBackend(PasqalBackend):
 
         analog_register = get_register_from_circuit(run_input)
 
-        seq = gen_seq(
+        seq = cached_gen_seq(
             analog_register=analog_register,
             device=self.target.device,
             circuit=run_input,
@@ -92,11 +93,11 @@ class EmuMpsBackend(PasqalBackend):
             bitstrings = BitStrings() if shots is None else BitStrings(num_shots=shots)
             config = MPSConfig(observables=[bitstrings])
             self._executor = MPSBackend(seq, config=config)
-
+            backend = deepcopy(self)
             job_id = str(uuid.uuid4())
 
             job = PasqalLocalJob(
-                backend=self,
+                backend=backend,
                 job_id=job_id,
                 shots=shots,
                 qobj_id=job_id,
@@ -14,6 +14,7 @@ from qiskit_pasqal_provider.providers.abstract_base import PasqalBackend, Pasqal
 from qiskit_pasqal_provider.providers.jobs import PasqalRemoteJob
 from qiskit_pasqal_provider.providers.pulse_utils import (
     PasqalRegister,
+    cached_gen_seq,
     gen_seq,
     get_register_from_circuit,
 )
@@ -97,11 +98,20 @@ class EmuRemoteBackend(PasqalBackend):
             # validate register from device layout; will throw an error if not compatible
             self.target.device.validate_register(analog_register)
 
-        seq = gen_seq(
-            analog_register=analog_register,
-            device=self.target.device,
-            circuit=run_input,
-        )
+            # the register with layout is a new object on each run, so the sequence
+            # cache would never be hit
+            seq = gen_seq(
+                analog_register=analog_register,
+                device=self.target.device,
+                circuit=run_input,
+            )
+
+        else:
+            seq = cached_gen_seq(
+                analog_register=analog_register,
+                device=self.target.device,
+                circuit=run_input,
+            )
 
         if values:
             seq = seq.build(**values)
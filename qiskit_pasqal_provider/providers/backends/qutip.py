@@ -15,7 +15,7 @@ from qiskit_pasqal_provider.providers.abstract_base import (
 )
 from qiskit_pasqal_provider.providers.jobs import PasqalLocalJob
 from qiskit_pasqal_provider.providers.pulse_utils import (
-    gen_seq,
+    cached_gen_seq,
     get_register_from_circuit,
 )
 from qiskit_pasqal_provider.providers.target import PasqalTarget
@@ -78,7 +78,7 @@ class QutipEmulatorBackend(PasqalBackend):
         # get the register from the analog gate inside `run_input` argument (QuantumCircuit)
         _analog_register = get_register_from_circuit(run_input)
 
-        seq = gen_seq(
+        seq = cached_gen_seq(
             analog_register=_analog_register,
             device=self.target.device,
             circuit=run_input,
@@ -1,7 +1,9 @@
 """Pasqal analog gate"""
 
+from functools import lru_cache
 from typing import Any, Union
 
+import numpy as np
 from numpy.typing import ArrayLike
 from pulser.math import AbstractArray
 from qiskit import qasm3
@@ -98,6 +100,15 @@ def _insert_gate_declaration(
     return "\n".join(lines) + "\n"
 
 
+@lru_cache(maxsize=64)
+def _make_register(coords: tuple[tuple[float, ...], ...]) -> PasqalRegister:
+    """
+    Build the analog register for the given coordinates. `PasqalRegister` is
+    immutable, so gates placed on the same coordinates share one instance.
+    """
+    return PasqalRegister.from_coordinates(coords=coords, prefix="q")
+
+
 class HamiltonianGate(Gate):
     """Hamiltonian gate, an analog gate."""
 
@@ -193,8 +204,8 @@ class HamiltonianGate(Gate):
             else coords
         )
 
-        self._analog_register = PasqalRegister.from_coordinates(
-            coords=new_coords, prefix="q"
+        self._analog_register = _make_register(
+            tuple(map(tuple, np.asarray(new_coords, dtype=float).tolist()))
         )
 
     @property
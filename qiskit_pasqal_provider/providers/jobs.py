@@ -46,8 +46,9 @@ class PasqalLocalJob(PasqalJob):
         self._status = JobStatus.RUNNING
         results = self._eval_run_method()
 
-        self.metadata["success"] = True
-        self.metadata["config"] = getattr(self._executor, "_config", None)
+        self.metadata.update(
+            success=True, config=getattr(self._executor, "_config", None)
+        )
 
         self._result = build_primitive_result(
             backend_name=self.backend().name,
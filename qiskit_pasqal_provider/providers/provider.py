@@ -2,6 +2,8 @@
 
 from typing import Any
 
+from pulser_pasqal import PasqalCloud
+
 from qiskit_pasqal_provider.providers.abstract_base import (
     PasqalBackend,
     PasqalBackendType,
@@ -38,6 +40,11 @@ class PasqalProvider:
             self.remote_config = remote_config
 
         self.options = options
+        # (name, target) -> (remote config, target cloud, options, backend)
+        self._backend_cache: dict[
+            tuple[str, PasqalTarget | None],
+            tuple[RemoteConfig | None, PasqalCloud | None, dict, PasqalBackend],
+        ] = {}
 
     def get_backend(
         self, backend_name: str, target: PasqalTarget | None = None
@@ -57,9 +64,26 @@ class PasqalProvider:
 
         Returns:
             A PasqalBackend instance. It will be a local or remote backend
-                depending on the specifications of the backend.
+                depending on the specifications of the backend. Backends are
+                cached per name and target on the provider instance, so repeated
+                calls return the same (mutable) backend instance; it is rebuilt if
+                the provider's `remote_config` or options, or the target's cloud,
+                have changed in between.
         """
 
+        cache_key = (backend_name, target)
+        cloud = None if target is None else target.cloud
+        cached = self._backend_cache.get(cache_key)
+
+        # targets compare without their cloud, so it is checked here
+        if (
+            cached is not None
+            and cached[0] is self.remote_config
+            and cached[1] is cloud
+            and cached[2] == self.options
+        ):
+            return cached[3]
+
         if backend_name in PasqalBackendType:
 
             try:
@@ -85,6 +109,12 @@ class PasqalProvider:
                 except NotImplementedError as exc:
                     raise ValueError(f"{backend_name} is not a valid backend") from exc
 
+            self._backend_cache[cache_key] = (
+                self.remote_config,
+                cloud,
+                dict(self.options),
+                _backend,
+            )
             return _backend
 
         raise ValueError(f"{backend_name} is not a valid backend")
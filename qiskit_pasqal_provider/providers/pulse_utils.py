@@ -1,9 +1,10 @@
 """Pasqal backend utilities"""
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from functools import reduce
+from functools import lru_cache, reduce
 
-from typing import Any, Literal
+from typing import Any, Callable, Literal
 import numpy as np
 import pulser
 from pulser import Pulse, Sequence
@@ -31,6 +32,12 @@ WaveformValueType = (
     | tuple["WaveformValueType", ...]
 )
 
+# maximum number of parametric sequences kept by `cached_gen_seq`
+SEQ_CACHE_MAXSIZE = 32
+_seq_cache: OrderedDict[tuple[int, ...], tuple[tuple[Any, ...], Sequence]] = (
+    OrderedDict()
+)
+
 
 class PasqalRegister(Register):
     """PasqalRegister class. To define a register for the PasqalBackend run method"""
@@ -107,6 +114,15 @@ class InterpolatePoints:
         else:
             raise ValueError("Argument 'n' must be the size of values argument.")
 
+        # stored once as a read-only array copy: `object` dtype keeps the symbolic
+        # entries, numeric-only points get a contiguous float64 array. Sequences
+        # built from the gate are cached, so the points must not change in place
+        if any(isinstance(v, ParameterExpression) for v in values):
+            values = np.array(values, dtype=object)
+        else:
+            values = np.array(values, dtype=np.float64)
+        values.setflags(write=False)
+
         self._n = n
         self._values = values
         self._duration = duration
@@ -121,8 +137,8 @@ class InterpolatePoints:
         return self._duration
 
     @property
-    def values(self) -> list | tuple | np.ndarray:
-        """data points for interpolation"""
+    def values(self) -> np.ndarray:
+        """data points for interpolation, as a read-only array"""
         return self._values
 
     @property
@@ -323,7 +339,7 @@ def _gen_phase_pulse(
         A parametric pulse with the phase InterpolatedWaveform containing detuning Variables.
     """
 
-    phase_wrapper = _get_param_values(seq, phase.values, True)  # type: ignore [arg-type]
+    phase_wrapper = _get_param_values(seq, phase.values, True)
 
     phase_wf = _gen_phase_wf(
         det_wrapper,
@@ -461,12 +477,25 @@ def _get_wf_values_parameter_expression(
     if not value.parameters:
         return value.numeric()
 
-    params = sorted(value.parameters, key=lambda p: p.name)
+    params, expr_fn = _lambdify_parameter_expression(value)
     param_values = [_get_wf_values_parameter(seq, param) for param in params]
+    return expr_fn(*param_values)
+
+
+@lru_cache(maxsize=128)
+def _lambdify_parameter_expression(
+    value: ParameterExpression,
+) -> tuple[list[Parameter], Callable[..., Any]]:
+    """
+    Compile a qiskit ParameterExpression into a callable of its parameters, sorted
+    by name. Compiling through sympy is costly, so results are cached per expression.
+    """
+
+    params = sorted(value.parameters, key=lambda p: p.name)
     expr_fn = lambdify(
         [param.name for param in params], value.sympify(), modules="numpy"
     )
-    return expr_fn(*param_values)
+    return params, expr_fn
 
 
 def gen_seq(
@@ -547,6 +576,55 @@ def gen_seq(
     return seq
 
 
+def cached_gen_seq(
+    analog_register: PasqalRegister | Register,
+    device: BaseDevice | PasqalDevice,
+    circuit: QuantumCircuit,
+) -> Sequence:
+    """
+    Memoized version of `gen_seq`. The (possibly parametric) sequence is reused
+    whenever the same circuit, with the same gate instances, is run on the same
+    register and device, so only `Sequence.build` is needed to bind new values.
+
+    Args:
+        analog_register: a PasqalRegister instance.
+        device: a PasqalDevice instance.
+        circuit: a qiskit QuantumCircuit instance.
+
+    Returns:
+        The pulser sequence containing the converted analog gate from the quantum circuit.
+        It must not be modified in place, since it may be shared between runs.
+
+    Up to `SEQ_CACHE_MAXSIZE` entries are kept process-wide, each holding strong
+    references to its circuit, register and device; use `clear_seq_cache` to
+    release them.
+    """
+
+    # the cache holds references to the key objects, so their ids cannot be reused
+    # while the entry is alive
+    refs = (circuit, analog_register, device) + tuple(
+        instr.operation for instr in circuit.data
+    )
+    key = tuple(id(obj) for obj in refs)
+
+    if key in _seq_cache:
+        _seq_cache.move_to_end(key)
+        return _seq_cache[key][1]
+
+    seq = gen_seq(analog_register=analog_register, device=device, circuit=circuit)
+    _seq_cache[key] = (refs, seq)
+
+    if len(_seq_cache) > SEQ_CACHE_MAXSIZE:
+        _seq_cache.popitem(last=False)
+
+    return seq
+
+
+def clear_seq_cache() -> None:
+    """Clear the sequences cached by `cached_gen_seq`, releasing their circuits."""
+    _seq_cache.clear()
+
+
 def _get_param_values(
     seq: Sequence,
     values: np.ndarray | tuple,
@@ -638,8 +716,8 @@ class RegisterTransform:
         self._grid = grid_transform if grid_transform is not None else "triangular"
         self._grid_scale = grid_scale
 
-        # defining self.raw_coords
-        if coords:
+        # defining self.raw_coords; `len` keeps array-like coords unambiguous
+        if coords is not None and len(coords) > 0:
             self._raw_coords = coords
 
         elif num_qubits:
@@ -694,7 +772,7 @@ class RegisterTransform:
         # triangular transformation matrix
         transform = np.array([[1.0, 0.0], [0.5, 0.8660254037844386]])
         return (
-            np.array(self._raw_coords)
+            np.asarray(self._raw_coords)
             * self._grid_scale
             * self.scale_factor
             @ transform
@@ -709,4 +787,4 @@ class RegisterTransform:
         """
 
         # for now, no transformation needed since the coords are list of tuple of ints
-        return np.array(self._raw_coords) * self._grid_scale * self.scale_factor
+        return np.asarray(self._raw_coords) * self._grid_scale * self.scale_factor
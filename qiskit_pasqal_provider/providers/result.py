@@ -4,31 +4,47 @@ import json
 import time
 from collections import Counter
 from collections.abc import Mapping
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from pasqal_cloud.batch import Batch as PasqalBatchData
-from pasqal_cloud.job import Job as PasqalJobData
 from pulser.backend import Results
 from pulser.backend.remote import BatchStatus, RemoteResults
-from pulser_simulation.simresults import SimulationResults
 from qiskit.primitives import DataBin, PrimitiveResult, SamplerPubResult
 
+# `pulser_simulation` pulls in QuTiP, so it is only imported when local simulation
+# results need to be handled; `pasqal_cloud` objects are only used for typing
+if TYPE_CHECKING:
+    from pasqal_cloud.batch import Batch as PasqalBatchData
+    from pasqal_cloud.job import Job as PasqalJobData
+    from pulser_simulation.simresults import SimulationResults
+
+_REMOTE_WAITING_STATUSES = {
+    BatchStatus.PENDING,
+    BatchStatus.RUNNING,
+    BatchStatus.PAUSED,
+}
+_CLOUD_WAITING_STATUSES = {"PENDING", "RUNNING"}
+
 
 def _get_counts(
-    results: SimulationResults | Results, metadata: dict[str, Any]
+    results: "SimulationResults | Results", metadata: dict[str, Any]
 ) -> Counter | dict[str, int | float]:
     """Get counts from pulser simulation results."""
-    if isinstance(results, SimulationResults):
-        if metadata["shots"] is None:
-            return results.sample_final_state()
-        return results.sample_final_state(N_samples=metadata["shots"])
-
     if isinstance(results, Results):
         if metadata.get("config"):
             obs = metadata["config"].observables[0]
             times = results.get_result_times(obs)
             return results.get_result(obs, times[-1])
 
+        raise ValueError("results must be a SimulationResults or Results.")
+
+    # pylint: disable-next=import-outside-toplevel
+    from pulser_simulation.simresults import SimulationResults
+
+    if isinstance(results, SimulationResults):
+        if metadata["shots"] is None:
+            return results.sample_final_state()
+        return results.sample_final_state(N_samples=metadata["shots"])
+
     raise ValueError("results must be a SimulationResults or Results.")
 
 
@@ -37,11 +53,14 @@ def _fetch_remote_pulser_sim_results(
 ) -> DataBin:
     """Fetch remote results from emulators via PasqalCloud."""
 
-    while results.get_batch_status() in {BatchStatus.PENDING, BatchStatus.RUNNING}:
-        time.sleep(metadata.get("sleep_sec", None) or 10)
+    while True:
+        status = results.get_batch_status()
+
+        if status in _REMOTE_WAITING_STATUSES:
+            time.sleep(metadata.get("sleep_sec", None) or 10)
+            continue
 
-    def get_result() -> DataBin:
-        match results.get_batch_status():
+        match status:
             case BatchStatus.DONE:
                 return DataBin(counts=results.results[0].sampling_dist)
             case BatchStatus.CANCELED:
@@ -50,21 +69,9 @@ def _fetch_remote_pulser_sim_results(
                 raise ValueError("Remote execution timed out.")
             case BatchStatus.ERROR:
                 raise ValueError("Remote execution error.")
-            case BatchStatus.PAUSED:
-                while results.get_batch_status() in {
-                    BatchStatus.PENDING,
-                    BatchStatus.RUNNING,
-                    BatchStatus.PAUSED,
-                }:
-                    time.sleep(metadata.get("sleep_sec", None) or 10)
-                    return get_result()
             case _:
                 raise NotImplementedError()
 
-        raise NotImplementedError()
-
-    return get_result()
-
 
 def _fetch_cloud_results(_results: dict[str, Any] | None, metadata: dict) -> DataBin:
     """Fetch results from `pasqal_cloud.SDK` connections."""
@@ -72,24 +79,28 @@ def _fetch_cloud_results(_results: dict[str, Any] | None, metadata: dict) -> Dat
     batch: PasqalBatchData = metadata["batch"]
     job_obj: PasqalJobData = batch.ordered_jobs[-1]
 
+    if job_obj.status in _CLOUD_WAITING_STATUSES:
+        _wait_for_cloud_batch(batch, metadata)
+        # refreshing the batch replaces its job objects
+        job_obj = batch.ordered_jobs[-1]
+
     if job_obj.status == "DONE":
         return _fetch_counter_results(job_obj.result)
 
-    while job_obj.status in {"PENDING", "RUNNING"}:
-        batch.refresh()
-        time.sleep(metadata.get("sleep_sec", None) or 15)
-
-        if job_obj.status == "DONE":
-            return _fetch_counter_results(job_obj.result)
-
-        if job_obj.status in {"TIMED_OUT", "ERROR"}:
-            break
-
     raise ValueError(
         "Something went wrong. Please check the cloud project page for more information."
     )
 
 
+def _wait_for_cloud_batch(batch: "PasqalBatchData", metadata: dict) -> None:
+    """Block until the last job of a cloud batch is no longer pending or running."""
+
+    # the SDK replaces the job objects on refresh, so the last job is read again
+    while batch.ordered_jobs[-1].status in _CLOUD_WAITING_STATUSES:
+        time.sleep(metadata.get("sleep_sec", None) or 15)
+        batch.refresh()
+
+
 def _fetch_counter_results(results: Mapping[str, Any] | Any) -> DataBin:
     """Build a data bin from a direct counts dictionary."""
     if not isinstance(results, Mapping):
@@ -118,20 +129,35 @@ def _fetch_legacy_payload_results(results: list[Any] | tuple[Any, ...]) -> DataB
     return _fetch_counter_results(payload)
 
 
+def _is_simulation_results(results: Any) -> bool:
+    """Check for local QuTiP results, importing `pulser_simulation` only here."""
+    # pylint: disable-next=import-outside-toplevel
+    from pulser_simulation.simresults import SimulationResults
+
+    return isinstance(results, SimulationResults)
+
+
+def _build_local_sim_data(
+    results: "SimulationResults | Results", metadata: dict[str, Any]
+) -> DataBin:
+    """Build a data bin from local pulser simulation results."""
+    data = DataBin(counts=_get_counts(results, metadata))
+    metadata["shots"] = int(sum(data.counts.values()))  # pylint: disable=E1101
+    return data
+
+
 def build_primitive_result(
     backend_name: str,
     job_id: str | list[str],
-    results: SimulationResults | RemoteResults | dict | list | tuple | None,
+    results: "SimulationResults | RemoteResults | dict | list | tuple | None",
     metadata: dict[str, Any] | None = None,
 ) -> PrimitiveResult[SamplerPubResult]:
     """Build a Qiskit PrimitiveResult from Pasqal backend outputs."""
     metadata = {} if metadata is None else dict(metadata)
 
     match results:
-        case SimulationResults() | Results():
-            counts = _get_counts(results, metadata)
-            data = DataBin(counts=counts)
-            metadata["shots"] = int(sum(data.counts.values()))  # pylint: disable=E1101
+        case Results():
+            data = _build_local_sim_data(results, metadata)
         case RemoteResults():
             if backend_name == "qpu":
                 raise NotImplementedError()
@@ -145,11 +171,12 @@ def build_primitive_result(
                 data = _fetch_counter_results(results)
         case None:
             data = _fetch_cloud_results(results, metadata)
+        case _ if _is_simulation_results(results):
+            data = _build_local_sim_data(results, metadata)
         case _:
             raise ValueError(
                 f"Unknown results format. Received {results} of type {type(results)}."
             )
 
-    metadata["backend_name"] = backend_name
-    metadata["job_id"] = job_id
+    metadata.update(backend_name=backend_name, job_id=job_id)
     return PrimitiveResult([SamplerPubResult(data=data)], metadata)
@@ -5,7 +5,9 @@ try:
 except ImportError:
     from qiskit_pasqal_provider.utils import StrEnum  # type: ignore [assignment]
 
-from dataclasses import replace
+import time
+from weakref import WeakKeyDictionary
+from dataclasses import dataclass, field, replace
 
 from pulser.devices import Device, AnalogDevice, DigitalAnalogDevice
 from pulser.register import RegisterLayout
@@ -18,10 +20,19 @@ AVAILABLE_DEVICES = {
     "hybrid": replace(DigitalAnalogDevice, name="HybridDevice"),
 }
 
+# time (in seconds) during which a fetched remote device is considered valid
+DEVICE_CACHE_TTL_SECONDS = 300.0
+
+# cloud -> (fetch time, device); entries go away with their cloud instance
+_device_cache: WeakKeyDictionary[PasqalCloud, tuple[float, Device]] = (
+    WeakKeyDictionary()
+)
+
 
 def fetch_remote_device(cloud: PasqalCloud) -> Device:
     """
-    Get the QPU device with current valid specs.
+    Get the QPU device with current valid specs. The device is cached per cloud
+    instance for `DEVICE_CACHE_TTL_SECONDS` seconds to avoid repeated requests.
 
     Args:
         cloud: A `PasqalCloud` instance
@@ -30,7 +41,15 @@ def fetch_remote_device(cloud: PasqalCloud) -> Device:
         A `Device` object for the available QPU
     """
 
-    return cloud.fetch_available_devices()["FRESNEL"]
+    now = time.monotonic()
+    cached = _device_cache.get(cloud)
+
+    if cached is not None and now - cached[0] < DEVICE_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    device = cloud.fetch_available_devices()["FRESNEL"]
+    _device_cache[cloud] = (now, device)
+    return device
 
 
 class PasqalDeviceType(StrEnum):
@@ -47,6 +66,7 @@ class PasqalDevice(Device):
     """A wrapper for pulser.device.Device class"""
 
 
+@dataclass(frozen=True, slots=True, init=False)
 class PasqalTarget:
     """
     Wrap Pulser device and layout objects for Pasqal backends.
@@ -54,13 +74,16 @@ class PasqalTarget:
     This class intentionally stays Pulser-oriented instead of inheriting
     ``qiskit.transpiler.Target``. Backends in this provider consume Pulser
     ``Device`` and ``RegisterLayout`` objects directly when building sequences.
+
+    Targets are immutable and compare (and hash) by device and layout, so they
+    can be used as cache keys.
     """
 
-    _device: PasqalDevice | Device
-    _accepts_new_layouts: bool
-    _pre_calibrated_layouts: tuple
-    _layout: PasqalLayout | RegisterLayout
-    _cloud: PasqalCloud | None
+    device: PasqalDevice | Device
+    layout: PasqalLayout | RegisterLayout
+    cloud: PasqalCloud | None = field(compare=False, repr=False)
+    _accepts_new_layouts: bool = field(compare=False, repr=False)
+    _pre_calibrated_layouts: tuple = field(compare=False, repr=False)
 
     def __init__(
         self,
@@ -81,9 +104,15 @@ class PasqalTarget:
                 Default to `None`.
         """
 
-        self._cloud = cloud
-        self._device = self._get_device(device)
-        self._layout = self._get_layout(layout)
+        # the instance is frozen, so attributes are set through `object.__setattr__`
+        object.__setattr__(self, "cloud", cloud)
+        new_device = self._get_device(device)
+        object.__setattr__(self, "device", new_device)
+        object.__setattr__(self, "_accepts_new_layouts", new_device.accepts_new_layouts)
+        object.__setattr__(
+            self, "_pre_calibrated_layouts", new_device.pre_calibrated_layouts
+        )
+        object.__setattr__(self, "layout", self._get_layout(layout))
 
     def _get_device(
         self, device: PasqalDeviceType | PasqalDevice | Device | str
@@ -91,21 +120,13 @@ class PasqalTarget:
         """Retrieve the correct device object given a device argument."""
 
         # if cloud is defined, fetch the device from it
-        if self._cloud:
-            new_device = fetch_remote_device(self._cloud)
-            self._accepts_new_layouts = new_device.accepts_new_layouts
-            self._pre_calibrated_layouts = new_device.pre_calibrated_layouts
-            return new_device
+        if self.cloud:
+            return fetch_remote_device(self.cloud)
 
         if isinstance(device, PasqalDeviceType | str):
-            new_device = AVAILABLE_DEVICES[device]
-            self._accepts_new_layouts = new_device.accepts_new_layouts
-            self._pre_calibrated_layouts = new_device.pre_calibrated_layouts
-            return new_device
+            return AVAILABLE_DEVICES[device]
 
         if isinstance(device, PasqalDevice | Device):
-            self._accepts_new_layouts = device.accepts_new_layouts
-            self._pre_calibrated_layouts = device.pre_calibrated_layouts
             return device
 
         raise TypeError(f"'{device.name}' of type {type(device)} is not supported")
@@ -146,12 +167,7 @@ class PasqalTarget:
 
         raise ValueError(f"device '{self.device.name}' does not accept new layouts")
 
-    @property
-    def device(self) -> PasqalDevice | Device:
-        """device attribute"""
-        return self._device
-
-    @property
-    def layout(self) -> PasqalLayout | RegisterLayout:
-        """layout attribute"""
-        return self._layout
+    @staticmethod
+    def clear_device_cache() -> None:
+        """Clear the cached remote devices, forcing them to be fetched again."""
+        _device_cache.clear()
@@ -1,6 +1,8 @@
 """Overall util classes and functions"""
 
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache
 from typing import Optional, Protocol, Any
 
 from pasqal_cloud.authentication import TokenProvider
@@ -15,50 +17,48 @@ class StrEnum(str, Enum):
 
     def __str__(self) -> str:
         """Used when dumping enum fields in a schema."""
-        ret: str = self.value
-        return ret
+        # `_value_` is the raw member value, skipping the `value` descriptor lookup
+        return self._value_  # pylint: disable=no-member
 
     @classmethod
-    def list(cls) -> list[str]:
-        """list the defined attributes as enum fields"""
-        return [c.value for c in cls]
+    def list(cls) -> tuple[str, ...]:
+        """list the defined attributes as enum fields, computed once per class"""
+        return _enum_values(cls)
 
 
+@cache
+def _enum_values(enum_cls: type[StrEnum]) -> tuple[str, ...]:
+    """Values of an enum class. Kept outside the class so it is not an enum member."""
+    return tuple(c.value for c in enum_cls)
+
+
+@dataclass(frozen=True, slots=True)
 class RemoteConfig:
-    """Remote configuration class for Pasqal provider access."""
-
-    def __init__(
-        self,
-        username: str = "",
-        password: str = "",
-        project_id: str = "",
-        token_provider: Optional[TokenProvider] = None,
-        endpoints: Optional[Endpoints] = None,
-        auth0: Optional[Auth0Conf] = None,
-        webhook: Optional[str] = None,
-    ):
-        """
-        A data wrapper class for accessing Pasqal's remote backend.
-
-        Args:
-            username: email of the user to login. Optional.
-            password: password of the user to login. Optional, but
-                must be present if `username` is provided.
-            project_id: ID of the owner project of the batch. Optional.
-            token_provider: the token provider for alternative log-in method.
-                Optional, but can be used to replace `username` log-in method.
-            endpoints: endpoints targeted of the public APIs.
-            auth0: `Auth0Config` instance to define the auth0 tenant to target.
-            webhook: webhook where the job results are automatically sent to.
-        """
+    """
+    A data wrapper class for accessing Pasqal's remote backend.
+
+    Args:
+        username: email of the user to login. Optional.
+        password: password of the user to login. Optional, but
+            must be present if `username` is provided.
+        project_id: ID of the owner project of the batch. Optional.
+        token_provider: the token provider for alternative log-in method.
+            Optional, but can be used to replace `username` log-in method.
+        endpoints: endpoints targeted of the public APIs.
+        auth0: `Auth0Config` instance to define the auth0 tenant to target.
+        webhook: webhook where the job results are automatically sent to.
+    """
+
+    username: str = ""
+    password: str = field(default="", repr=False)
+    project_id: str = ""
+    token_provider: Optional[TokenProvider] = field(default=None, repr=False)
+    endpoints: Optional[Endpoints] = None
+    auth0: Optional[Auth0Conf] = None
+    webhook: Optional[str] = None
 
-        self.username = username
-        self.password = password
-        self.project_id = project_id
-        self.token_provider = token_provider
-        self.endpoints = endpoints
-        self.auth0 = auth0
-        self.webhook = webhook
+    # `endpoints` and `auth0` are not hashable, so neither is the config
+    __hash__ = None
 
 
 class PasqalExecutor(Protocol):
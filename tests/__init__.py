@@ -7,14 +7,21 @@ np.random.seed(42)
 
 NUM_ATOMS = 12
 ATOM_ORDER = tuple(f"q{k}" for k in range(0, NUM_ATOMS))
+_FMT = f"0{NUM_ATOMS}b"
 
 
 def _gen_dict_result() -> dict:
     """generate a dictionary result"""
     _res = {}
-    _res[np.binary_repr(9, NUM_ATOMS)] = 50
-    _res[np.binary_repr(11, NUM_ATOMS)] = 25
+    _res[format(9, _FMT)] = 50
+    _res[format(11, _FMT)] = 25
     return _res
 
 
 DEFAULT_DICT_RESULT = _gen_dict_result()
+
+
+def fresh_default_result() -> dict:
+    """independent copy of `DEFAULT_DICT_RESULT`; a flat copy is enough for its
+    immutable str/int entries"""
+    return DEFAULT_DICT_RESULT.copy()
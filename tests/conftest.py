@@ -1,14 +1,16 @@
 """fixture for tests."""
 
+import os
 import sys
 import typing
-import json
 import uuid
-from copy import deepcopy
-from typing import Any, Mapping
+from dataclasses import replace
+from functools import cache
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Any, Callable, Iterator, Mapping
 
 from unittest.mock import MagicMock
-from collections import defaultdict
 
 import numpy as np
 import pytest
@@ -27,9 +29,17 @@ from pulser.backend.remote import (
     JobStatus,
     BatchStatus,
 )
-from pulser.devices import Device
-
-from qiskit_pasqal_provider.providers.pulse_utils import InterpolatePoints
+from pulser.devices import AnalogDevice, Device
+from qiskit.circuit import Parameter, QuantumCircuit
+
+from qiskit_pasqal_provider.providers.abstract_base import PasqalBackend
+from qiskit_pasqal_provider.providers.gate import HamiltonianGate
+from qiskit_pasqal_provider.providers.provider import PasqalProvider
+from qiskit_pasqal_provider.providers.pulse_utils import (
+    InterpolatePoints,
+    clear_seq_cache,
+)
+from qiskit_pasqal_provider.providers.sampler import SamplerV2
 from qiskit_pasqal_provider.providers.layouts import (
     SquareLayout,
 )
@@ -38,40 +48,146 @@ from qiskit_pasqal_provider.providers.target import (
     AVAILABLE_DEVICES,
     PasqalTarget,
 )
-from tests import DEFAULT_DICT_RESULT, ATOM_ORDER, NUM_ATOMS
+from tests import ATOM_ORDER, NUM_ATOMS, fresh_default_result
 
+HAS_EMU_MPS = find_spec("emu_mps") is not None
+requires_emu_mps = pytest.mark.skipif(
+    sys.platform in ["win32", "cygwin"] or not HAS_EMU_MPS,
+    reason="Windows or missing emu_mps dependency",
+)
 
-@pytest.fixture
-def square_coords() -> list:
-    """simple square coordinates."""
-    return [(0, 0), (0, 1), (1, 0), (1, 1)]
 
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports() -> None:
+    """
+    import the emulators the backends load lazily (`pulser_simulation` pulls in
+    QuTiP), so their import cost is paid at session setup, not by the first test.
+    """
+    import_module("pulser_simulation")
+    if HAS_EMU_MPS:
+        import_module("emu_mps")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module", autouse=True)
+def _clear_seq_cache() -> Iterator[None]:
+    """
+    release the pulser sequences cached by the backends once each test module is done.
+    """
+    yield
+    clear_seq_cache()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """add the `--runslow` option to also run tests marked as slow."""
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run slow tests"
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """register the `slow` marker."""
+    config.addinivalue_line("markers", "slow: mark test as slow to run")
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """
+    skip tests marked as slow unless `--runslow` is given, and group the tests
+    using the same local backend so `pytest-xdist --dist=loadgroup` runs each
+    backend on its own worker.
+    """
+    run_slow = config.getoption("--runslow")
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    # `xdist_group` is only known when pytest-xdist is installed
+    has_xdist = config.pluginmanager.hasplugin("xdist")
+
+    for item in items:
+        if not run_slow and "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+        callspec = getattr(item, "callspec", None)
+        if has_xdist and callspec is not None and "local_backend" in callspec.params:
+            item.add_marker(
+                pytest.mark.xdist_group(name=callspec.params["local_backend"])
+            )
+
+
+@cache
+def _interp(values: tuple[float, ...]) -> InterpolatePoints:
+    """
+    shared `InterpolatePoints` instance for constant values; its values array is
+    read-only, so the instance can be reused across tests.
+    """
+    return InterpolatePoints(values=list(values))
+
+
+@pytest.fixture(scope="session")
+def interp() -> Callable[[tuple[float, ...]], InterpolatePoints]:
+    """
+    fixture for the cached factory of constant `InterpolatePoints` instances.
+    """
+    return _interp
+
+
+@pytest.fixture(name="square_coords", scope="session")
+def fixture_square_coords() -> np.ndarray:
+    """simple square coordinates, as a read-only array."""
+    coords = np.array([(0, 0), (0, 1), (1, 0), (1, 1)], dtype=np.float64)
+    coords.setflags(write=False)
+    return coords
+
+
+@pytest.fixture(scope="session")
 def null_interpolate_points() -> InterpolatePoints:
     """constant null interpolate points instance."""
-    return InterpolatePoints(values=[0.0, 0.0, 0.0])
+    return InterpolatePoints(values=np.array([0.0, 0.0, 0.0], dtype=np.float64))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def constant_interpolate_points() -> InterpolatePoints:
     """constant 'normalized' interpolate points instance."""
-    return InterpolatePoints(values=[1.0, 1.0, 1.0, 1.0])
+    return InterpolatePoints(values=np.array([1.0, 1.0, 1.0, 1.0], dtype=np.float64))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def linear_interpolate_points() -> InterpolatePoints:
     """linear interpolate points instance."""
-    return InterpolatePoints(values=[0.0, 1.0 / 3, 2.0 / 3, 1.0])
+    return InterpolatePoints(
+        values=np.array([0.0, 1.0 / 3, 2.0 / 3, 1.0], dtype=np.float64)
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bump_interpolate_points() -> InterpolatePoints:
     """bump interpolate points instance."""
-    return InterpolatePoints(values=[0.0, 1.0, 1.0, 0.0])
+    return InterpolatePoints(values=np.array([0.0, 1.0, 1.0, 0.0], dtype=np.float64))
 
 
-@pytest.fixture
+@pytest.fixture(name="phase")
+def fixture_phase(request: pytest.FixtureRequest) -> float | InterpolatePoints:
+    """
+    phase for the analog gate, built from its name only when a test requests it
+    (use with `indirect=True` parametrization).
+    """
+    match request.param:
+        case "zero":
+            return 0.0
+        case "zero_vec2":
+            return InterpolatePoints(values=[0.0, 0.0])
+        case "ramp_vec2":
+            return InterpolatePoints(values=[0, 1.0])
+        case "zero_vec3":
+            return InterpolatePoints(values=[0.0, 0.0, 0.0])
+        case "bump_vec3":
+            return InterpolatePoints(values=[0, 1.0, 0])
+        case "param_vec3":
+            return InterpolatePoints(values=Parameter("p"), n=3)
+        case _:
+            raise ValueError(f"unknown phase spec {request.param!r}")
+
+
+@pytest.fixture(scope="session")
 def pasqal_target() -> PasqalTarget:
     """
     fixture for pre-defined pasqal target instance.
@@ -79,7 +195,7 @@ def pasqal_target() -> PasqalTarget:
     return PasqalTarget(device=AVAILABLE_DEVICES["analog"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pasqal_register() -> PasqalRegister:
     """
     fixture for rectangle-shaped Pasqal Register instance.
@@ -87,7 +203,7 @@ def pasqal_register() -> PasqalRegister:
     return PasqalRegister.rectangle(1, 4, spacing=5, prefix="atom")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def square_register2x2() -> PasqalRegister:
     """
     fixture for square-shaped Pasqal Register instance.
@@ -95,7 +211,7 @@ def square_register2x2() -> PasqalRegister:
     return PasqalRegister.square(2, spacing=5, prefix="atom")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pasqal_device() -> PasqalDevice | Device:
     """
     fixture for pulser.devices.AnalogDevice object.
@@ -103,7 +219,7 @@ def pasqal_device() -> PasqalDevice | Device:
     return AVAILABLE_DEVICES["analog"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def hybrid_device() -> PasqalDevice | Device:
     """
     fixture for pulser.devices.AnalogDevice object.
@@ -111,7 +227,23 @@ def hybrid_device() -> PasqalDevice | Device:
     return AVAILABLE_DEVICES["hybrid"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mock_analog_device() -> Device:
+    """
+    fixture for a custom analog device that accepts new layouts but has no
+    pre-calibrated ones.
+    """
+    return replace(
+        AnalogDevice,
+        name="ExampleDevice",
+        dimensions=2,
+        rydberg_level=61,
+        accepts_new_layouts=True,
+        pre_calibrated_layouts=(),
+    )
+
+
+@pytest.fixture(scope="session")
 def square_layout2x2() -> SquareLayout:
     """
     fixture for pulser square layout instance (2x2).
@@ -119,7 +251,7 @@ def square_layout2x2() -> SquareLayout:
     return SquareLayout(2, 2, spacing=5)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def square_layout1() -> SquareLayout:
     """
     fixture for pulser square layout instance.
@@ -127,6 +259,95 @@ def square_layout1() -> SquareLayout:
     return SquareLayout(7, 4, spacing=5)
 
 
+@pytest.fixture(scope="module")
+def analog_circuit(square_coords: np.ndarray) -> QuantumCircuit:
+    """
+    fixture for a non-parametric circuit holding a single analog gate. Tests must
+    not mutate it; use `.copy()` to get an independent circuit.
+    """
+    gate = HamiltonianGate(
+        _interp((1, 1, 1)),
+        _interp((0, 0.5, 1)),
+        0.0,
+        square_coords,
+        grid_transform="square",
+        transform=True,
+    )
+    qc = QuantumCircuit(len(square_coords))
+    qc.append(gate, qc.qubits)
+    return qc
+
+
+@pytest.fixture(scope="module")
+def parametric_analog_circuit(square_coords: np.ndarray) -> QuantumCircuit:
+    """
+    fixture for a circuit holding a single analog gate whose amplitude and detuning
+    values are the parameters `a` and `d` (sorted by name in `qc.parameters`).
+    """
+    gate = HamiltonianGate(
+        InterpolatePoints(values=Parameter("a"), n=3),
+        InterpolatePoints(values=Parameter("d"), n=3),
+        0.0,
+        square_coords,
+        grid_transform="square",
+        transform=True,
+    )
+    qc = QuantumCircuit(len(square_coords))
+    qc.append(gate, qc.qubits)
+    return qc
+
+
+@pytest.fixture(name="pasqal_provider", scope="session")
+def fixture_pasqal_provider() -> PasqalProvider:
+    """
+    fixture for a local Pasqal provider; it caches the backends it builds.
+    """
+    return PasqalProvider()
+
+
+@pytest.fixture(name="qutip_backend", scope="session")
+def fixture_qutip_backend(pasqal_provider: PasqalProvider) -> PasqalBackend:
+    """
+    fixture for the local qutip backend, built once per session (i.e. once per
+    pytest-xdist worker).
+    """
+    return pasqal_provider.get_backend("qutip")
+
+
+@pytest.fixture(
+    name="local_backend",
+    scope="session",
+    params=[
+        "qutip",
+        pytest.param("emu-mps", marks=[requires_emu_mps, pytest.mark.slow]),
+    ],
+)
+def fixture_local_backend(
+    request: pytest.FixtureRequest, pasqal_provider: PasqalProvider
+) -> PasqalBackend:
+    """
+    fixture for each local emulator backend, built once per session (i.e. once
+    per pytest-xdist worker).
+    """
+    return pasqal_provider.get_backend(request.param)
+
+
+@pytest.fixture(scope="session")
+def qutip_sampler(qutip_backend: PasqalBackend) -> SamplerV2:
+    """
+    fixture for a sampler bound to the session qutip backend.
+    """
+    return SamplerV2(qutip_backend)
+
+
+@pytest.fixture(scope="session")
+def local_sampler(local_backend: PasqalBackend) -> SamplerV2:
+    """
+    fixture for a sampler bound to each local emulator backend.
+    """
+    return SamplerV2(local_backend)
+
+
 class MockServer:
     """A mock server to simulate job progress and manage job states.
 
@@ -138,7 +359,7 @@ class MockServer:
     def __init__(self) -> None:
         """Initialize the mock server with empty job data and progress counters."""
         self.jobs: dict[str, Job] = {}
-        self.jobs_progress_counter: dict[str, int] = defaultdict(int)
+        self.jobs_progress_counter: dict[str, int] = {}
         # Set how many progress steps are needed before each batch is marked as done
         self.max_progress_steps = 3
 
@@ -174,17 +395,27 @@ class MockServer:
         Args:
             job_id (str): The ID of the job for which progress is being simulated.
         """
-        progress_step = self.jobs_progress_counter[job_id]
+        job = self.jobs[job_id]
+        progress_step = self.jobs_progress_counter.get(job_id, 0)
         if progress_step == 0:
-            self.jobs[job_id].status = "RUNNING"
-        if progress_step >= self.max_progress_steps:
-            self.jobs[job_id].status = "DONE"
-            self.jobs[job_id]._full_result = {  # pylint: disable=protected-access
-                "counter": deepcopy(DEFAULT_DICT_RESULT),
+            job.status = "RUNNING"
+        elif progress_step >= self.max_progress_steps:
+            job.status = "DONE"
+            job._full_result = {  # pylint: disable=protected-access
+                "counter": fresh_default_result(),
                 "raw": [],
                 "serialised_results": None,
             }
-        self.jobs_progress_counter[job_id] += 1
+        self.jobs_progress_counter[job_id] = progress_step + 1
+
+
+def _uuid4_strings(n: int) -> list[str]:
+    """Generate `n` random UUID4 strings from a single `os.urandom` call."""
+    raw = os.urandom(16 * n)
+    # `version=4` also sets the RFC 4122 variant bits
+    return [
+        str(uuid.UUID(bytes=raw[k : k + 16], version=4)) for k in range(0, len(raw), 16)
+    ]
 
 
 class MockSDK:
@@ -197,17 +428,18 @@ class MockSDK:
         libraries using the SDK.
     """
 
+    # constant fields shared by every mock job and its batch
+    _JOB_DEFAULTS: dict[str, Any] = {
+        "created_at": "",
+        "updated_at": "",
+        "project_id": "",
+        "status": "DONE",
+    }
+    _BATCH_DEFAULTS: dict[str, Any] = {**_JOB_DEFAULTS, "user_id": ""}
+
     def __init__(self) -> None:
         self.mock_server = MockServer()
-
-    def get_device_specs_dict(self) -> Any:
-        """Retrieve the device specifications from a local JSON file."""
-        with open(
-            "tests/cloud_fixtures/device_specs.json",
-            "r",
-            encoding=sys.getfilesystemencoding(),
-        ) as f:
-            return json.load(f)
+        self._client = MagicMock()
 
     def create_batch(
         self,
@@ -219,31 +451,17 @@ class MockSDK:
         wait: bool = False,  # pylint: disable=unused-argument
     ) -> Batch:
         """Create a batch of jobs and simulate its creation in the mock server."""
-        batch_id = str(uuid.uuid4())
+        batch_id, *job_ids = _uuid4_strings(len(jobs) + 1)
+        common = {**self._JOB_DEFAULTS, "batch_id": batch_id}
         batch = Batch(
             id=batch_id,
             open=bool(open),
             complete=bool(open),
-            created_at="",
-            updated_at="",
             device_type=(device_type or DeviceTypeName.FRESNEL).value,
-            project_id="",
-            user_id="",
-            status="DONE",
-            jobs=[
-                {
-                    **j,
-                    "batch_id": batch_id,
-                    "id": str(uuid.uuid4()),
-                    "project_id": "",
-                    "status": "DONE",
-                    "created_at": "",
-                    "updated_at": "",
-                }
-                for j in jobs
-            ],
+            jobs=[{**j, **common, "id": k} for j, k in zip(jobs, job_ids)],
             configuration=configuration,
-            _client=MagicMock(),
+            _client=self._client,
+            **self._BATCH_DEFAULTS,
         )
 
         self.mock_server.set_job(batch.ordered_jobs[0])
@@ -268,13 +486,19 @@ class MockSDK:
         )
 
 
+@cache
+def _mock_job_id(batch_id: str) -> str:
+    """Deterministic mock job id for a batch, hashed once per batch id"""
+    return str(uuid.uuid3(uuid.NAMESPACE_OID, batch_id))
+
+
 class MockConnection(RemoteConnection):
     """MockConnection class to emulate `pulser` RemoteConnection"""
 
     def __init__(self):
         """Define MockConnection"""
         self.results = [MockResult()]
-        self._job_id = lambda batch_id: str(uuid.uuid3(uuid.NAMESPACE_OID, batch_id))
+        self._job_id = _mock_job_id
 
     def submit(
         self,
@@ -312,6 +536,11 @@ class MockConnection(RemoteConnection):
         return [self._job_id(batch_id)]
 
 
+_MOCK_WEIGHTS = np.zeros(NUM_ATOMS)
+_MOCK_WEIGHTS[[9, 11]] = (50, 25)
+_MOCK_WEIGHTS.setflags(write=False)
+
+
 class MockResult(Result):
     """MockResult to emulate pulser Result"""
 
@@ -326,11 +555,7 @@ class MockResult(Result):
 
     def _weights(self) -> np.ndarray:
         """Get weights as numpy array"""
-
-        weights = np.zeros(NUM_ATOMS)
-        weights[9] = 50
-        weights[11] = 25
-        return weights
+        return _MOCK_WEIGHTS
 
 
 @pytest.fixture
@@ -11,6 +11,7 @@ from qiskit_pasqal_provider.providers.pulse_utils import (
     PasqalRegister,
     InterpolatePoints,
     ObjWrapper,
+    _lambdify_parameter_expression,
 )
 from qiskit_pasqal_provider.providers.gate import (
     HamiltonianGate,
@@ -30,9 +31,21 @@ def test_interpolate_points() -> None:
 
     wf = InterpolatePoints(values=values, duration=t)
 
-    assert all(k == p == v for k, p, v in zip(wf.values, np.array(values), values))
+    np.testing.assert_array_equal(wf.values, np.asarray(values, dtype=object))
+    assert wf.values.dtype == object
     assert wf.times is None
 
+    numeric_wf = InterpolatePoints(values=[0, 1, 1, 0])
+    assert numeric_wf.values.dtype == np.float64
+    assert numeric_wf.values.flags.c_contiguous
+
+    # values are a read-only copy, so cached sequences cannot go stale
+    raw = np.array([0.0, 1.0, 0.0])
+    frozen_wf = InterpolatePoints(values=raw)
+    assert raw.flags.writeable
+    with pytest.raises(ValueError):
+        frozen_wf.values[0] = 2.0
+
     with pytest.raises(AssertionError):
         InterpolatePoints(values=values, duration="t")
 
@@ -42,6 +55,19 @@ def test_interpolate_points() -> None:
     assert wf2.times is not None
 
 
+def test_parameter_expression_is_compiled_once() -> None:
+    """testing compiled parameter expressions are reused and evaluate correctly."""
+
+    p = Parameter("p")
+    t = Parameter("t")
+
+    params, expr_fn = _lambdify_parameter_expression(2 * p + t)
+
+    assert [param.name for param in params] == ["p", "t"]
+    assert expr_fn(1.0, 0.5) == pytest.approx(2.5)
+    assert _lambdify_parameter_expression(2 * p + t)[1] is expr_fn
+
+
 def test_obj_wrapper_handles_none_inputs() -> None:
     """testing `ObjWrapper` with None inputs."""
 
@@ -55,7 +81,7 @@ def test_analog_gate(
     phase: float | InterpolatePoints,
     constant_interpolate_points: InterpolatePoints,
     linear_interpolate_points: InterpolatePoints,
-    square_coords: list,
+    square_coords: np.ndarray,
 ) -> None:
     """testing `HamiltonianGate` class correctness"""
 
@@ -110,10 +136,17 @@ def test_analog_gate(
     phase_expr_gate = HamiltonianGate(ampl, det, p + 0.1, coords=square_coords)
     assert p in phase_expr_gate.params
 
+    # gates on the same coordinates share one immutable register
+    assert phase_expr_gate.analog_register is hg.analog_register
+
     _analog_register = PasqalRegister.from_coordinates(square_coords, prefix="q")
 
-    assert np.all([hg.analog_register, _analog_register])  # type: ignore [arg-type]
-    assert np.all([hg.coords, _analog_register.qubits])  # type: ignore [arg-type]
+    assert hg.analog_register == _analog_register
+    assert list(hg.coords) == list(_analog_register.qubits)
+    assert np.array_equal(
+        np.asarray([np.asarray(c) for c in hg.coords.values()]),
+        np.asarray([np.asarray(c) for c in _analog_register.qubits.values()]),
+    )
 
     with pytest.raises(AttributeError):
         hg.control()
@@ -127,11 +160,11 @@ def test_analog_gate(
     qc = QuantumCircuit(len(square_coords))
     assert qc.append(hg, qc.qubits)
 
-    for instruction in qc.data:
-        assert isinstance(instruction.operation, HamiltonianGate)
+    assert len(qc.data) == 1
+    assert qc.data[0].operation is hg
 
 
-def test_openqasm3_transport_roundtrip_scalar_phase(square_coords: list) -> None:
+def test_openqasm3_transport_roundtrip_scalar_phase(square_coords: np.ndarray) -> None:
     """testing OpenQASM3 transport roundtrip with scalar phase."""
 
     pytest.importorskip("qiskit_qasm3_import")
@@ -165,7 +198,7 @@ def test_openqasm3_transport_roundtrip_scalar_phase(square_coords: list) -> None
 @pytest.mark.parametrize("num_points", [2, 3, 5, 8])
 @pytest.mark.parametrize("with_times", [False, True])
 def test_openqasm3_transport_roundtrip_scalar_phase_varying_points(
-    square_coords: list, num_points: int, with_times: bool
+    square_coords: np.ndarray, num_points: int, with_times: bool
 ) -> None:
     """testing OpenQASM3 transport scalar-phase roundtrip with varying points."""
 
@@ -197,7 +230,9 @@ def test_openqasm3_transport_roundtrip_scalar_phase_varying_points(
         assert restored_gate.detuning.times is None
 
 
-def test_hamiltonian_gate_parameter_order_is_deterministic(square_coords: list) -> None:
+def test_hamiltonian_gate_parameter_order_is_deterministic(
+    square_coords: np.ndarray,
+) -> None:
     """testing HamiltonianGate parameter order is deterministic."""
 
     a = Parameter("a")
@@ -212,7 +247,9 @@ def test_hamiltonian_gate_parameter_order_is_deterministic(square_coords: list)
     assert [param.name for param in gate.params] == ["a", "b", "c"]
 
 
-def test_openqasm3_transport_roundtrip_phase_waveform(square_coords: list) -> None:
+def test_openqasm3_transport_roundtrip_phase_waveform(
+    square_coords: np.ndarray,
+) -> None:
     """testing OpenQASM3 transport roundtrip with phase waveform."""
 
     pytest.importorskip("qiskit_qasm3_import")
@@ -238,7 +275,7 @@ def test_openqasm3_transport_roundtrip_phase_waveform(square_coords: list) -> No
 @pytest.mark.parametrize("num_points", [2, 4, 7])
 @pytest.mark.parametrize("with_times", [False, True])
 def test_openqasm3_transport_roundtrip_phase_waveform_varying_points(
-    square_coords: list, num_points: int, with_times: bool
+    square_coords: np.ndarray, num_points: int, with_times: bool
 ) -> None:
     """testing OpenQASM3 transport phase-waveform roundtrip with varying points."""
 
@@ -289,7 +326,7 @@ def test_openqasm3_transport_roundtrip_phase_waveform_varying_points(
     ],
 )
 def test_openqasm3_transport_roundtrip_varying_amp_det_profiles(
-    square_coords: list,
+    square_coords: np.ndarray,
     ampl_values: list[float],
     det_values: list[float],
     times: list[float] | None,
@@ -317,7 +354,9 @@ def test_openqasm3_transport_roundtrip_varying_amp_det_profiles(
         assert np.allclose(restored_gate.detuning.times, times)
 
 
-def test_openqasm3_transport_rejects_parametric_phase(square_coords: list) -> None:
+def test_openqasm3_transport_rejects_parametric_phase(
+    square_coords: np.ndarray,
+) -> None:
     """testing OpenQASM3 transport rejects unresolved parameter expressions."""
 
     p = Parameter("p")
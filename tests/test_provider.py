@@ -14,10 +14,16 @@ def test_provider_empty_remote() -> None:
 
     assert provider.remote_config is None
     assert isinstance(provider.get_backend("qutip"), QutipEmulatorBackend)
+    backend = provider.get_backend("qutip")
+    assert provider.get_backend("qutip") is backend
 
     with pytest.raises(AssertionError):
         provider.get_backend("remote-emu-free")
 
+    # a new remote configuration must not be served a stale backend
+    provider.remote_config = RemoteConfig()
+    assert provider.get_backend("qutip") is not backend
+
 
 def test_provider_with_remote() -> None:
     """test provider instance attributes and methods with remote_config"""
@@ -1,21 +1,21 @@
 """Test provider result conversion helpers."""
 
 import json
+import sys
 import uuid
-from copy import deepcopy
 from typing import Any, cast
 
 import pytest
 from pasqal_cloud.job import CreateJob, Job
-from pulser.backend.remote import RemoteConnection, RemoteResults
+from pulser.backend.remote import BatchStatus, RemoteConnection, RemoteResults
 from pulser.result import Result
 from qiskit.primitives import PrimitiveResult
 from qiskit.providers.jobstatus import JobStatus
 
 from qiskit_pasqal_provider.providers.jobs import PasqalRemoteJob
 from qiskit_pasqal_provider.providers.result import build_primitive_result
-from tests import DEFAULT_DICT_RESULT
-from tests.conftest import MockSDK
+from tests import DEFAULT_DICT_RESULT, fresh_default_result
+from tests.conftest import MockConnection, MockSDK
 
 
 def test_mock_remote_sim_result(
@@ -51,7 +51,7 @@ def test_mock_cloud_sim_result(mock_sdk: MockSDK, mock_result: Result) -> None:
         _client=None,
     )
     job._full_result = {  # pylint: disable=protected-access
-        "counter": deepcopy(DEFAULT_DICT_RESULT),
+        "counter": fresh_default_result(),
         "raw": [],
         "serialised_results": None,
     }
@@ -62,7 +62,7 @@ def test_mock_cloud_sim_result(mock_sdk: MockSDK, mock_result: Result) -> None:
     result = build_primitive_result(
         backend_name="MockBackend",
         job_id="",
-        results=deepcopy(DEFAULT_DICT_RESULT),
+        results=fresh_default_result(),
         metadata=metadata,
     )
     counts = result[0].data.counts
@@ -75,7 +75,7 @@ def test_counter_result_without_batch_metadata(mock_result: Result) -> None:
     result = build_primitive_result(
         backend_name="MockBackend",
         job_id="",
-        results={"counter": deepcopy(DEFAULT_DICT_RESULT)},
+        results={"counter": fresh_default_result()},
         metadata={"status": "DONE"},
     )
     counts = result[0].data.counts
@@ -86,7 +86,7 @@ def test_counter_result_without_batch_metadata(mock_result: Result) -> None:
 def test_legacy_wait_true_payload_list_is_supported(mock_result: Result) -> None:
     """Test that legacy wait=True payload lists produce a PrimitiveResult."""
 
-    payload = json.dumps({"counter": deepcopy(DEFAULT_DICT_RESULT)})
+    payload = json.dumps({"counter": DEFAULT_DICT_RESULT})
     result = build_primitive_result(
         backend_name="MockBackend",
         job_id="",
@@ -126,7 +126,7 @@ def test_mock_cloud_result_rejects_malformed_counter(mock_sdk: MockSDK) -> None:
         build_primitive_result(
             backend_name="MockBackend",
             job_id="",
-            results=deepcopy(DEFAULT_DICT_RESULT),
+            results=fresh_default_result(),
             metadata=metadata,
         )
 
@@ -282,3 +282,90 @@ def test_remote_job_wait_false_is_non_blocking() -> None:
 
     assert job.metadata["status"] == "RUNNING"
     assert job.status() == JobStatus.RUNNING
+
+
+def test_unknown_result_format_is_rejected() -> None:
+    """Test that unsupported result types raise a clear error."""
+
+    with pytest.raises(ValueError, match="Unknown results format"):
+        build_primitive_result(
+            backend_name="MockBackend",
+            job_id="",
+            results=42,  # type: ignore[arg-type]
+        )
+
+
+def test_counter_result_does_not_need_pulser_simulation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that non-local results are built without importing `pulser_simulation`."""
+
+    # a `None` entry makes any import of the module fail
+    monkeypatch.setitem(sys.modules, "pulser_simulation.simresults", None)
+
+    result = build_primitive_result("MockBackend", "", {"0000": 3})
+    assert result[0].data.counts == {"0000": 3}
+
+
+@pytest.mark.parametrize("final_status", ["DONE", "ERROR"])
+def test_cloud_result_waits_for_running_job(final_status: str) -> None:
+    """Test that cloud results poll running jobs until they finish."""
+
+    def make_job(status: str) -> Any:
+        return type("Job", (), {"status": status, "result": fresh_default_result()})()
+
+    class MockBatch:
+        """Minimal batch stub whose job finishes after two refreshes."""
+
+        def __init__(self) -> None:
+            self.ordered_jobs = [make_job("PENDING")]
+            self.refresh_count = 0
+
+        def refresh(self) -> None:
+            """Replace the job objects, as the SDK does."""
+            self.refresh_count += 1
+            status = final_status if self.refresh_count > 1 else "RUNNING"
+            self.ordered_jobs = [make_job(status)]
+
+    batch = MockBatch()
+    metadata = {"batch": batch, "status": None, "sleep_sec": 0.001}
+
+    if final_status == "DONE":
+        result = build_primitive_result("MockBackend", "", None, metadata)
+        assert result[0].data.counts == DEFAULT_DICT_RESULT
+
+    else:
+        with pytest.raises(ValueError, match="Something went wrong"):
+            build_primitive_result("MockBackend", "", None, metadata)
+
+    assert batch.refresh_count == 2
+
+
+def test_mock_remote_sim_result_waits_through_pause(
+    mock_sdk: MockSDK, mock_result: Result, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that paused remote batches are waited on until they are done."""
+
+    statuses = [
+        BatchStatus.PENDING,
+        BatchStatus.PAUSED,
+        BatchStatus.RUNNING,
+        BatchStatus.PAUSED,
+    ]
+
+    conn = MockConnection()
+    monkeypatch.setattr(
+        conn,
+        "_get_batch_status",
+        lambda batch_id: statuses.pop(0) if statuses else BatchStatus.DONE,
+    )
+    batch = mock_sdk.create_batch("", [CreateJob(runs=1000, variables={})])
+    result = build_primitive_result(
+        backend_name="MockBackend",
+        job_id="",
+        results=RemoteResults(batch.id, connection=conn),
+        metadata={"sleep_sec": 0.001},
+    )
+
+    assert result[0].data.counts == mock_result.sampling_dist
+    assert not statuses
@@ -1,56 +1,40 @@
 """Test sampler instance"""
 
-from importlib.util import find_spec
-from sys import platform
+from typing import Any, Callable
 
+import numpy as np
 import pytest
 from pulser import Register, Sequence
 from qiskit.circuit import Parameter, QuantumCircuit
 from qiskit.primitives import PrimitiveResult
 
 from qiskit_pasqal_provider.providers.gate import HamiltonianGate, InterpolatePoints
-from qiskit_pasqal_provider.providers.provider import PasqalProvider
+from qiskit_pasqal_provider.providers import pulse_utils
+from qiskit_pasqal_provider.providers.pulse_utils import clear_seq_cache, gen_seq
 from qiskit_pasqal_provider.providers.sampler import SamplerV2
 from qiskit_pasqal_provider.providers.target import AVAILABLE_DEVICES
 
-HAS_EMU_MPS = find_spec("emu_mps") is not None
+# parameter values bound to the parametric amplitude and detuning waveforms
+AMP_VALUES = np.ones(3)
+DET_VALUES = np.linspace(0.0, 1.0, 3)
+AMP_VALUES.setflags(write=False)
+DET_VALUES.setflags(write=False)
 
 
 @pytest.mark.parametrize(
-    "phase",
-    [
-        0.0,
-        InterpolatePoints(
-            values=[
-                0.0,
-                0.0,
-            ]
-        ),
-        InterpolatePoints(values=[0, 1.0]),
-        InterpolatePoints(values=[0.0, 0.0, 0.0]),
-    ],
-)
-@pytest.mark.parametrize(
-    "backend_name",
-    [
-        "qutip",
-        pytest.param(
-            "emu-mps",
-            marks=pytest.mark.skipif(
-                platform in ["win32", "cygwin"] or not HAS_EMU_MPS,
-                reason="Windows or missing emu_mps dependency",
-            ),
-        ),
-    ],
+    "phase", ["zero", "zero_vec2", "ramp_vec2", "zero_vec3"], indirect=True
 )
 def test_local_sampler_backends(
-    backend_name: str, phase: float | InterpolatePoints, square_coords: list
+    local_sampler: SamplerV2,
+    phase: float | InterpolatePoints,
+    square_coords: np.ndarray,
+    interp: Callable[[tuple[float, ...]], InterpolatePoints],
 ) -> None:
     """Testing sampler instance with qutip and emu-mps emulators (local provider)."""
 
     # analog gate properties
-    ampl = InterpolatePoints(values=[1, 1, 1])
-    det = InterpolatePoints(values=[0, 0.5, 1])
+    ampl = interp((1, 1, 1))
+    det = interp((0, 0.5, 1))
 
     # analog gate
     gate = HamiltonianGate(
@@ -61,44 +45,29 @@ def test_local_sampler_backends(
     qc = QuantumCircuit(4)
     qc.append(gate, qc.qubits)
 
-    provider = PasqalProvider()
-    backend = provider.get_backend(backend_name)
-    sampler = SamplerV2(backend)
-    results = sampler.run([qc]).result()
+    results = local_sampler.run([qc]).result()
 
     assert isinstance(results, PrimitiveResult)
 
     with pytest.raises(ValueError):
         seq = Sequence(Register({"q0": (2, -1)}), device=AVAILABLE_DEVICES["analog"])
-        sampler.run([seq])
+        local_sampler.run([seq])
 
 
 @pytest.mark.parametrize(
     "phase,extra",
     [
-        (0.0, ()),
-        (InterpolatePoints(values=Parameter("p"), n=3), (0, 1, 0)),
-        (InterpolatePoints(values=[0, 1.0, 0]), ()),
-    ],
-)
-@pytest.mark.parametrize(
-    "backend_name",
-    [
-        "qutip",
-        pytest.param(
-            "emu-mps",
-            marks=pytest.mark.skipif(
-                platform in ["win32", "cygwin"] or not HAS_EMU_MPS,
-                reason="Windows or missing emu_mps dependency",
-            ),
-        ),
+        ("zero", ()),
+        ("param_vec3", (0, 1, 0)),
+        ("bump_vec3", ()),
     ],
+    indirect=["phase"],
 )
 def test_local_sampler_backends_parametric(
-    backend_name: str,
+    local_sampler: SamplerV2,
     phase: float | InterpolatePoints,
     extra: tuple,
-    square_coords: list,
+    square_coords: np.ndarray,
 ) -> None:
     """
     Testing sampler instance with qutip and emu-mps emulators (local provider) with
@@ -121,93 +90,50 @@ def test_local_sampler_backends_parametric(
     qc = QuantumCircuit(4)
     qc.append(gate, qc.qubits)
 
-    provider = PasqalProvider()
-    backend = provider.get_backend(backend_name)
-    sampler = SamplerV2(backend)
-
     if isinstance(phase, InterpolatePoints):
         if isinstance(phase.values[0], Parameter):
             p = phase.values[0]
-            results = sampler.run(
-                [(qc, {a: [1, 1, 1], d: [0, 0.5, 1], p: extra})]
+            results = local_sampler.run(
+                [(qc, {a: AMP_VALUES, d: DET_VALUES, p: extra})]
             ).result()
 
         else:
-            results = sampler.run([(qc, {a: [1, 1, 1], d: [0, 0.5, 1]})]).result()
+            results = local_sampler.run([(qc, {a: AMP_VALUES, d: DET_VALUES})]).result()
 
     else:
-        results = sampler.run([(qc, {a: [1, 1, 1], d: [0, 0.5, 1]})]).result()
+        results = local_sampler.run([(qc, {a: AMP_VALUES, d: DET_VALUES})]).result()
 
     assert isinstance(results, PrimitiveResult)
 
 
-def test_sampler_rejects_multiple_pubs(square_coords: list) -> None:
+def test_sampler_rejects_multiple_pubs(
+    qutip_sampler: SamplerV2, analog_circuit: QuantumCircuit
+) -> None:
     """Test sampler rejects multiple pubs."""
 
-    gate = HamiltonianGate(
-        InterpolatePoints(values=[1, 1, 1]),
-        InterpolatePoints(values=[0, 0.5, 1]),
-        0.0,
-        square_coords,
-        grid_transform="square",
-        transform=True,
-    )
-
-    qc1 = QuantumCircuit(4)
-    qc1.append(gate, qc1.qubits)
-    qc2 = QuantumCircuit(4)
-    qc2.append(gate, qc2.qubits)
-
-    sampler = SamplerV2(PasqalProvider().get_backend("qutip"))
     with pytest.raises(ValueError, match="exactly one pub per run"):
-        sampler.run([qc1, qc2], shots=10)
+        qutip_sampler.run([analog_circuit, analog_circuit.copy()], shots=10)
 
 
-def test_sampler_rejects_empty_circuit() -> None:
+def test_sampler_rejects_empty_circuit(qutip_sampler: SamplerV2) -> None:
     """Test sampler rejects circuits without analog gates."""
 
-    sampler = SamplerV2(PasqalProvider().get_backend("qutip"))
     with pytest.raises(ValueError, match="at least one analog gate"):
-        sampler.run([QuantumCircuit(1)], shots=10)
+        qutip_sampler.run([QuantumCircuit(1)], shots=10)
 
 
-def test_qutip_metadata_uses_qobj_id(square_coords: list) -> None:
+def test_qutip_metadata_uses_qobj_id(
+    qutip_sampler: SamplerV2, analog_circuit: QuantumCircuit
+) -> None:
     """Test qutip run metadata uses `qobj_id` key."""
 
-    gate = HamiltonianGate(
-        InterpolatePoints(values=[1, 1, 1]),
-        InterpolatePoints(values=[0, 0.5, 1]),
-        0.0,
-        square_coords,
-        grid_transform="square",
-        transform=True,
-    )
-
-    qc = QuantumCircuit(4)
-    qc.append(gate, qc.qubits)
-
-    result = (
-        SamplerV2(PasqalProvider().get_backend("qutip")).run([qc], shots=10).result()
-    )
+    result = qutip_sampler.run([analog_circuit], shots=10).result()
     assert "qobj_id" in result.metadata
     assert "qojb_id" not in result.metadata
 
 
-@pytest.mark.parametrize(
-    "backend_name",
-    [
-        "qutip",
-        pytest.param(
-            "emu-mps",
-            marks=pytest.mark.skipif(
-                platform in ["win32", "cygwin"] or not HAS_EMU_MPS,
-                reason="Windows or missing emu_mps dependency",
-            ),
-        ),
-    ],
-)
 def test_local_sampler_backends_parametric_phase_parameter(
-    backend_name: str, square_coords: list
+    local_sampler: SamplerV2, square_coords: np.ndarray
 ) -> None:
     """Testing sampler instance with qiskit.Parameter as scalar phase."""
 
@@ -227,28 +153,13 @@ def test_local_sampler_backends_parametric_phase_parameter(
     qc = QuantumCircuit(4)
     qc.append(gate, qc.qubits)
 
-    provider = PasqalProvider()
-    sampler = SamplerV2(provider.get_backend(backend_name))
-    results = sampler.run([(qc, {a: [1, 1, 1], d: [0, 0.5, 1], p: 0.1})]).result()
+    results = local_sampler.run([(qc, {a: AMP_VALUES, d: DET_VALUES, p: 0.1})]).result()
 
     assert isinstance(results, PrimitiveResult)
 
 
-@pytest.mark.parametrize(
-    "backend_name",
-    [
-        "qutip",
-        pytest.param(
-            "emu-mps",
-            marks=pytest.mark.skipif(
-                platform in ["win32", "cygwin"] or not HAS_EMU_MPS,
-                reason="Windows or missing emu_mps dependency",
-            ),
-        ),
-    ],
-)
 def test_local_sampler_backends_parametric_phase_expression(
-    backend_name: str, square_coords: list
+    local_sampler: SamplerV2, square_coords: np.ndarray
 ) -> None:
     """Testing sampler instance with qiskit.ParameterExpression as scalar phase."""
 
@@ -268,28 +179,13 @@ def test_local_sampler_backends_parametric_phase_expression(
     qc = QuantumCircuit(4)
     qc.append(gate, qc.qubits)
 
-    provider = PasqalProvider()
-    sampler = SamplerV2(provider.get_backend(backend_name))
-    results = sampler.run([(qc, {a: [1, 1, 1], d: [0, 0.5, 1], p: 0.2})]).result()
+    results = local_sampler.run([(qc, {a: AMP_VALUES, d: DET_VALUES, p: 0.2})]).result()
 
     assert isinstance(results, PrimitiveResult)
 
 
-@pytest.mark.parametrize(
-    "backend_name",
-    [
-        "qutip",
-        pytest.param(
-            "emu-mps",
-            marks=pytest.mark.skipif(
-                platform in ["win32", "cygwin"] or not HAS_EMU_MPS,
-                reason="Windows or missing emu_mps dependency",
-            ),
-        ),
-    ],
-)
 def test_local_sampler_backends_parametric_duration_expression(
-    backend_name: str, square_coords: list
+    local_sampler: SamplerV2, square_coords: np.ndarray
 ) -> None:
     """Testing sampler instance with qiskit.ParameterExpression as waveform duration."""
 
@@ -307,8 +203,42 @@ def test_local_sampler_backends_parametric_duration_expression(
     qc = QuantumCircuit(4)
     qc.append(gate, qc.qubits)
 
-    provider = PasqalProvider()
-    sampler = SamplerV2(provider.get_backend(backend_name))
-    results = sampler.run([(qc, {t: 1000})]).result()
+    results = local_sampler.run([(qc, {t: 1000})]).result()
 
     assert isinstance(results, PrimitiveResult)
+
+
+def test_sampler_reuses_parametric_sequence(
+    qutip_sampler: SamplerV2,
+    parametric_analog_circuit: QuantumCircuit,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that repeated runs of the same circuit reuse its pulser sequence."""
+
+    qc = parametric_analog_circuit
+    a, d = qc.parameters
+    gate = qc.data[0].operation
+
+    calls = []
+
+    def counting_gen_seq(**kwargs: Any) -> Sequence:
+        calls.append(kwargs["circuit"])
+        return gen_seq(**kwargs)
+
+    monkeypatch.setattr(pulse_utils, "gen_seq", counting_gen_seq)
+    clear_seq_cache()
+
+    for amp in (1, 2):
+        results = qutip_sampler.run(
+            [(qc, {a: amp * AMP_VALUES, d: DET_VALUES})]
+        ).result()
+        assert isinstance(results, PrimitiveResult)
+
+    assert len(calls) == 1 and calls[0] is qc
+
+    # a new circuit must not be served from another circuit's cache entry
+    qc2 = QuantumCircuit(4)
+    qc2.append(gate, qc2.qubits)
+    qutip_sampler.run([(qc2, {a: AMP_VALUES, d: DET_VALUES})]).result()
+
+    assert len(calls) == 2 and calls[1] is qc2
@@ -1,9 +1,12 @@
 """Testing device and target objects"""
 
-from dataclasses import replace
+import gc
+import weakref
+from dataclasses import FrozenInstanceError
+from unittest.mock import MagicMock
 
 import pytest
-from pulser.devices import Device, AnalogDevice
+from pulser.devices import Device
 
 from qiskit_pasqal_provider.providers.target import (
     PasqalTarget,
@@ -34,20 +37,50 @@ def test_target_with_device_types(
     assert PasqalTarget(hybrid_device, square_layout1)
 
 
-def test_target_with_custom_device(square_layout1: SquareLayout) -> None:
+def test_target_with_custom_device(
+    mock_analog_device: Device, square_layout1: SquareLayout
+) -> None:
     """Test PasqalTarget with custom device and layout"""
-    mock_device = replace(
-        AnalogDevice,
-        name="ExampleDevice",
-        dimensions=2,
-        rydberg_level=61,
-        accepts_new_layouts=True,
-        pre_calibrated_layouts=(),
-    )
 
     # no layout, should fail
     with pytest.raises(ValueError):
-        PasqalTarget(mock_device, None)
+        PasqalTarget(mock_analog_device, None)
 
     # define layout, should pass
-    assert PasqalTarget(mock_device, square_layout1)
+    assert PasqalTarget(mock_analog_device, square_layout1)
+
+
+def test_target_caches_remote_device(pasqal_device: Device) -> None:
+    """Test that remote devices are fetched once per cloud instance"""
+
+    cloud = MagicMock()
+    cloud.fetch_available_devices.return_value = {"FRESNEL": pasqal_device}
+
+    PasqalTarget.clear_device_cache()
+
+    assert PasqalTarget(cloud=cloud).device is pasqal_device
+    assert PasqalTarget(cloud=cloud).device is pasqal_device
+    cloud.fetch_available_devices.assert_called_once()
+
+    PasqalTarget.clear_device_cache()
+    assert PasqalTarget(cloud=cloud).device is pasqal_device
+    assert cloud.fetch_available_devices.call_count == 2
+
+    # the cache must not keep the cloud (and its session) alive
+    cloud_ref = weakref.ref(cloud)
+    del cloud
+    gc.collect()
+    assert cloud_ref() is None
+
+
+def test_target_is_frozen_and_hashable(square_layout1: SquareLayout) -> None:
+    """Test that targets are immutable and usable as cache keys"""
+
+    target = PasqalTarget("hybrid", square_layout1)
+
+    assert target == PasqalTarget("hybrid", square_layout1)
+    assert hash(target) == hash(PasqalTarget("hybrid", square_layout1))
+    assert target != PasqalTarget("analog")
+
+    with pytest.raises(FrozenInstanceError):
+        target.layout = None  # type: ignore [misc]
@@ -0,0 +1,57 @@
+"""Testing overall util classes and functions"""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from qiskit_pasqal_provider.utils import RemoteConfig, StrEnum
+
+
+class Color(StrEnum):
+    """StrEnum subclass for tests"""
+
+    RED = "red"
+    BLUE = "blue"
+
+
+class Shape(StrEnum):
+    """Another StrEnum subclass for tests"""
+
+    SQUARE = "square"
+
+
+def test_str_enum_list_is_cached_per_class() -> None:
+    """Test `StrEnum.list` values and their per-class caching"""
+
+    assert Color.list() == ("red", "blue")
+    assert Color.list() is Color.list()
+    assert "red" in Color.list()
+    assert str(Color.RED) == "red"
+
+    # the cache must not leak values between subclasses
+    assert Shape.list() == ("square",)
+
+
+def test_remote_config_equality() -> None:
+    """Test `RemoteConfig` compares by field values"""
+
+    config = RemoteConfig(username="user", password="pwd", project_id="123")
+
+    assert config == RemoteConfig(username="user", password="pwd", project_id="123")
+    assert config != RemoteConfig(username="user", password="pwd", project_id="456")
+    assert config != "user"
+
+
+def test_remote_config_is_frozen() -> None:
+    """Test `RemoteConfig` is immutable, unhashable and hides credentials"""
+
+    config = RemoteConfig(username="user", password="pwd", project_id="123")
+
+    assert config.username == "user"
+    assert "pwd" not in repr(config)
+
+    with pytest.raises(TypeError):
+        hash(config)
+
+    with pytest.raises(FrozenInstanceError):
+        config.username = "other"  # type: ignore[misc]